@@ -2,23 +2,13 @@ from agent import AgentConfig
 import models
 from python.helpers import runtime, settings, defer
 from python.helpers.print_style import PrintStyle
-from python.helpers.log_config import configure_logging, get_logger, LogSubsystem
-import os
+from python.helpers.log_config import configure_logging_from_env, get_logger, LogSubsystem
 
 
 # Initialize logging system at module load time
 def initialize_logging():
     """Initialize unified logging system with redaction support"""
-    log_level = os.getenv("A0_LOG_LEVEL", "INFO")
-    log_file = os.getenv("A0_LOG_FILE", None)
-    enable_file = os.getenv("A0_LOG_TO_FILE", "false").lower() == "true"
-
-    configure_logging(
-        level=log_level,
-        log_file=log_file if enable_file else None,
-        enable_redaction=True,
-        enable_console=True
-    )
+    configure_logging_from_env()
 
     log = get_logger(LogSubsystem.AGENT)
     log.debug("Logging system initialized")
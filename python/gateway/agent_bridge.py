@@ -12,14 +12,29 @@ File: python/gateway/agent_bridge.py
 import asyncio
 import logging
 import threading
-from typing import AsyncGenerator, Dict, Optional, Any, Callable, Awaitable
+from collections import defaultdict
+from types import MappingProxyType
+from typing import AsyncGenerator, Dict, Mapping, Optional, Any, Callable, Awaitable
 from datetime import datetime, timezone
 from dataclasses import dataclass
 
+import anyio
+
 logger = logging.getLogger("gateway.agent_bridge")
 
+# Session key prefix (with separator) per channel; unknown channels use their first two letters
+_CHANNEL_PREFIX = {
+    "telegram": "tg:",
+    "discord": "dc:",
+    "email": "em:",
+    "slack": "sl:",
+    "wechat": "wx:",
+    "whatsapp": "wa:",
+    "matrix": "mx:",
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class ChannelSession:
     """Channel session information"""
     context_id: str
@@ -39,8 +54,11 @@ class ChannelSession:
 class AgentBridge:
     """Gateway and Agent Zero Bridge Layer (Thread-Safe Version)"""
 
-    # Streaming response end marker
-    _STREAM_END = object()
+    # Chunks buffered between the agent and a slow stream consumer
+    _STREAM_BUFFER_SIZE = 16
+
+    # Number of per-session-key locks guarding context creation/removal
+    _LOCK_SHARDS = 8
 
     def __init__(self, default_config: Any = None):
         """
@@ -53,18 +71,29 @@ class AgentBridge:
         self._default_config = default_config
         self._config_initialized = False
         self._sessions: Dict[str, ChannelSession] = {}
-        self._lock = threading.Lock()  # Thread lock protection
+        # Read-only copy of _sessions, rebuilt on every mutation (copy-on-write)
+        self._snapshot: Mapping[str, ChannelSession] = MappingProxyType({})
+        # Secondary index: channel -> {session_key: session}
+        self._by_channel: Dict[str, Dict[str, ChannelSession]] = defaultdict(dict)
+        # Short critical sections only: session dict/index/snapshot updates
+        self._lock = threading.Lock()
+        # Serialize slow per-session work (context create/remove) by key shard,
+        # so different users do not wait on each other
+        self._shard_locks = [threading.Lock() for _ in range(self._LOCK_SHARDS)]
 
     def _ensure_config(self):
         """Ensure configuration is initialized"""
-        if not self._config_initialized:
-            if self._default_config is None:
-                try:
-                    from initialize import initialize_agent
-                    self._default_config = initialize_agent()
-                except ImportError:
-                    logger.warning("Could not import initialize_agent, using None config")
-            self._config_initialized = True
+        if self._config_initialized:
+            return
+        with self._lock:
+            if not self._config_initialized:
+                if self._default_config is None:
+                    try:
+                        from initialize import initialize_agent
+                        self._default_config = initialize_agent()
+                    except ImportError:
+                        logger.warning("Could not import initialize_agent, using None config")
+                self._config_initialized = True
 
     @property
     def default_config(self):
@@ -78,17 +107,14 @@ class AgentBridge:
 
         Use prefix to distinguish channels, avoiding conflicts with Web UI's random IDs
         """
-        prefix_map = {
-            "telegram": "tg",
-            "discord": "dc",
-            "email": "em",
-            "slack": "sl",
-            "wechat": "wx",
-            "whatsapp": "wa",
-            "matrix": "mx",
-        }
-        prefix = prefix_map.get(channel, channel[:2])
-        return f"{prefix}:{channel_user_id}"
+        prefix = _CHANNEL_PREFIX.get(channel)
+        if prefix is None:
+            prefix = channel[:2] + ":"
+        return prefix + str(channel_user_id)
+
+    def _shard_lock(self, session_key: str) -> threading.Lock:
+        """Lock serializing create/remove for one session key"""
+        return self._shard_locks[hash(session_key) % self._LOCK_SHARDS]
 
     def get_or_create_context(
         self,
@@ -109,13 +135,14 @@ class AgentBridge:
 
         session_key = self._make_session_key(channel, channel_user_id)
 
-        with self._lock:  # Thread lock protection
+        with self._shard_lock(session_key):
             # Try to get existing context
             existing_ctx = AgentContext.get(session_key)
             if existing_ctx:
                 # Update activity time
-                if session_key in self._sessions:
-                    self._sessions[session_key].last_activity = datetime.now(timezone.utc)
+                session = self._snapshot.get(session_key)
+                if session is not None:
+                    session.last_activity = datetime.now(timezone.utc)
                 return existing_ctx
 
             # Create new context
@@ -129,13 +156,15 @@ class AgentBridge:
             )
 
             # Record session info
-            self._sessions[session_key] = ChannelSession(
+            session = ChannelSession(
                 context_id=session_key,
                 channel=channel,
                 channel_user_id=channel_user_id,
                 channel_chat_id=channel_chat_id,
                 user_name=user_name,
             )
+            with self._lock:
+                self._set_session(session_key, session)
 
             logger.info(f"Created new context: {session_key}")
             return ctx
@@ -243,18 +272,27 @@ class AgentBridge:
         """
         Process message and return streaming response (race condition fixed)
 
-        Uses sentinel value to mark end, avoiding race conditions
+        Chunks pass through a bounded anyio memory object stream; the agent
+        is throttled when the consumer falls behind, and closing the send
+        side ends iteration without a sentinel value.
 
         Yields:
             Response chunks
         """
-        response_queue: asyncio.Queue = asyncio.Queue()
+        send_stream, receive_stream = anyio.create_memory_object_stream(
+            max_buffer_size=self._STREAM_BUFFER_SIZE
+        )
+        loop = asyncio.get_running_loop()
 
         async def stream_callback(chunk: str, full: str):
-            await response_queue.put(chunk)
+            # The agent runs on its own event loop thread, so hand the send
+            # over to this loop and wait for it (backpressure)
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(send_stream.send(chunk), loop)
+            )
 
         async def process_task():
-            try:
+            async with send_stream:
                 await self.process_message(
                     channel=channel,
                     channel_user_id=channel_user_id,
@@ -266,18 +304,13 @@ class AgentBridge:
                     channel_config=channel_config,
                     stream_callback=stream_callback,
                 )
-            finally:
-                # Use sentinel value to explicitly mark end
-                await response_queue.put(self._STREAM_END)
 
         task = asyncio.create_task(process_task())
 
         try:
-            while True:
-                chunk = await response_queue.get()
-                if chunk is self._STREAM_END:
-                    break
-                yield chunk
+            async with receive_stream:
+                async for chunk in receive_stream:
+                    yield chunk
         finally:
             if not task.done():
                 task.cancel()
@@ -292,31 +325,55 @@ class AgentBridge:
         with self._lock:
             return self._sessions.get(session_key)
 
-    def list_sessions(self) -> Dict[str, ChannelSession]:
-        """List all sessions (thread-safe)"""
-        with self._lock:
-            return self._sessions.copy()
+    def _set_session(self, session_key: str, session: ChannelSession):
+        """Add or replace a session (must be called within lock)"""
+        previous = self._sessions.get(session_key)
+        if previous is not None and previous.channel != session.channel:
+            self._unindex_session(session_key, previous)
+        self._sessions[session_key] = session
+        self._by_channel[session.channel][session_key] = session
+        self._snapshot = MappingProxyType(dict(self._sessions))
+
+    def _del_session(self, session_key: str):
+        """Remove a session (must be called within lock)"""
+        self._unindex_session(session_key, self._sessions.pop(session_key))
+        self._snapshot = MappingProxyType(dict(self._sessions))
+
+    def _unindex_session(self, session_key: str, session: ChannelSession):
+        """Drop a session from the channel index (must be called within lock)"""
+        channel_sessions = self._by_channel.get(session.channel)
+        if channel_sessions is not None:
+            channel_sessions.pop(session_key, None)
+            if not channel_sessions:
+                del self._by_channel[session.channel]
+
+    def list_sessions(self) -> Mapping[str, ChannelSession]:
+        """
+        List all sessions (thread-safe)
+
+        Returns a read-only snapshot that is only rebuilt when sessions are
+        added or removed, so reads need neither the lock nor a copy.
+        """
+        return self._snapshot
 
     def remove_session(self, channel: str, channel_user_id: str) -> bool:
         """Remove session (thread-safe)"""
         from agent import AgentContext
 
         session_key = self._make_session_key(channel, channel_user_id)
-        with self._lock:
-            if session_key in self._sessions:
-                del self._sessions[session_key]
-                AgentContext.remove(session_key)
-                logger.info(f"Removed session: {session_key}")
-                return True
-            return False
+        with self._shard_lock(session_key):
+            with self._lock:
+                if session_key not in self._sessions:
+                    return False
+                self._del_session(session_key)
+            AgentContext.remove(session_key)
+            logger.info(f"Removed session: {session_key}")
+            return True
 
     def get_sessions_by_channel(self, channel: str) -> Dict[str, ChannelSession]:
         """Get all sessions for a specific channel"""
         with self._lock:
-            return {
-                k: v for k, v in self._sessions.items()
-                if v.channel == channel
-            }
+            return dict(self._by_channel.get(channel, {}))
 
     def get_active_session_count(self) -> int:
         """Get active session count"""
@@ -5,8 +5,8 @@ File: python/gateway/deduplicator.py
 """
 
 import logging
+import time
 from collections import OrderedDict
-from datetime import datetime, timedelta
 from typing import Optional
 import threading
 
@@ -26,7 +26,10 @@ class MessageDeduplicator:
         """
         self.ttl_seconds = ttl_seconds
         self.max_size = max_size
-        self._seen: OrderedDict[str, datetime] = OrderedDict()
+        self._ttl_ns = int(ttl_seconds * 1_000_000_000)
+        # LRU order: oldest first, hits are moved to the end.
+        # Values are time.monotonic_ns() stamps, immune to wall-clock jumps
+        self._seen: OrderedDict[str, int] = OrderedDict()
         self._lock = threading.Lock()
 
     def is_duplicate(self, message_id: str, channel: str) -> bool:
@@ -41,35 +44,40 @@ class MessageDeduplicator:
             True if duplicate message
         """
         key = f"{channel}:{message_id}"
-        now = datetime.now()
+        now = time.monotonic_ns()
 
         with self._lock:
-            # Clean expired records
-            self._cleanup(now)
-
-            if key in self._seen:
+            timestamp = self._seen.get(key)
+            if timestamp is not None and now - timestamp < self._ttl_ns:
+                self._seen.move_to_end(key)
                 logger.debug(f"Duplicate message detected: {key}")
                 return True
 
             self._seen[key] = now
+            self._seen.move_to_end(key)
+            self._cleanup(now)
             return False
 
-    def _cleanup(self, now: datetime):
-        """Clean expired records (must be called within lock)"""
-        cutoff = now - timedelta(seconds=self.ttl_seconds)
+    def _cleanup(self, now: int):
+        """Evict expired and over-capacity records (must be called within lock)
+
+        Hits reorder entries, so expiry is lazy: only the expired prefix is
+        dropped here, and is_duplicate re-checks the timestamp of any hit.
+        """
+        cutoff = now - self._ttl_ns
+
+        # Limit size
+        while len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
 
         # Clean expired
         while self._seen:
             key, timestamp = next(iter(self._seen.items()))
-            if timestamp < cutoff:
+            if timestamp <= cutoff:
                 del self._seen[key]
             else:
                 break
 
-        # Limit size (use >= to ensure room for new entry)
-        while len(self._seen) >= self.max_size:
-            self._seen.popitem(last=False)
-
     def clear(self):
         """Clear all records"""
         with self._lock:
@@ -43,8 +43,15 @@ def create_app():
     from fastapi import FastAPI, HTTPException, Depends
     from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse, ORJSONResponse
     from contextlib import asynccontextmanager
 
+    try:
+        import orjson  # noqa: F401
+        default_response_class = ORJSONResponse
+    except ImportError:
+        default_response_class = JSONResponse
+
     security = HTTPBearer(auto_error=False)
 
     def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> bool:
@@ -173,7 +180,8 @@ def create_app():
     app = FastAPI(
         title="Agent Zero Gateway",
         version="4.1.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=default_response_class,
     )
 
     app.add_middleware(
@@ -256,16 +264,34 @@ def create_app():
 app = create_app()
 
 
-def run_gateway(host: str = "127.0.0.1", port: int = 18900, reload: bool = False, log_level: str = "info"):
-    """Run Gateway server"""
+def run_gateway(
+    host: str = "127.0.0.1",
+    port: int = 18900,
+    reload: bool = False,
+    log_level: str = "info",
+    loop: str = "asyncio",
+    http: str = "auto",
+    workers: Optional[int] = None,
+):
+    """Run Gateway server
+
+    Args:
+        loop: uvicorn event loop implementation. Keep "asyncio": agent.py
+            applies nest_asyncio, which cannot patch a uvloop loop.
+        http: uvicorn HTTP protocol implementation ("auto", "httptools", "h11")
+        workers: Number of worker processes (ignored with reload). Every
+            worker runs its own channel adapters and session state, so only
+            use more than one when channels are disabled or run elsewhere.
+    """
     import uvicorn
 
-    # 禁用 uvloop 以兼容 nest_asyncio
     uvicorn.run(
         "python.gateway.server:app",
         host=host,
         port=port,
         reload=reload,
         log_level=log_level,
-        loop="asyncio",  # 使用标准 asyncio 而不是 uvloop
+        loop=loop,
+        http=http,
+        workers=None if reload else workers,
     )
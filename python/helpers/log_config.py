@@ -16,8 +16,10 @@ Usage:
 """
 
 import logging
+import re
 import sys
 import os
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from enum import Enum
 from contextlib import contextmanager
@@ -46,6 +48,11 @@ try:
 except ImportError:
     pass
 
+# Context adapters keyed by (subsystem, sorted context items), least
+# recently used first; per-session contexts would otherwise grow it forever
+_LOGGER_CACHE_MAX = 256
+_logger_cache: "OrderedDict[tuple, ContextAdapter]" = OrderedDict()
+
 
 class RedactionFilter(logging.Filter):
     """
@@ -55,10 +62,15 @@ class RedactionFilter(logging.Filter):
     placeholder format: §§secret(KEY)
     """
 
+    # Same threshold SecretsManager.mask_values applies to secret values
+    MIN_SECRET_LENGTH = 4
+
     def __init__(self):
         super().__init__()
         self._manager = None
         self._init_attempted = False
+        self._secrets_ref = None
+        self._pattern: Optional[re.Pattern] = None
 
     def _get_manager(self):
         """Lazy load SecretsManager to avoid circular imports"""
@@ -71,12 +83,28 @@ class RedactionFilter(logging.Filter):
                 pass
         return self._manager
 
+    def _get_pattern(self, manager) -> Optional[re.Pattern]:
+        """Compiled alternation of current secret values, rebuilt when the secrets cache changes"""
+        secrets = manager.load_secrets()
+        if secrets is not self._secrets_ref:
+            values = sorted(
+                {v for v in secrets.values() if v and len(v.strip()) >= self.MIN_SECRET_LENGTH},
+                key=len,
+                reverse=True,
+            )
+            self._pattern = re.compile("|".join(map(re.escape, values))) if values else None
+            self._secrets_ref = secrets
+        return self._pattern
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Apply redaction to log message"""
         manager = self._get_manager()
-        if manager and hasattr(record, 'msg') and isinstance(record.msg, str):
+        if manager and isinstance(getattr(record, 'msg', None), str) and record.msg:
             try:
-                record.msg = manager.mask_values(record.msg)
+                # Single regex scan; only messages containing a secret pay for masking
+                pattern = self._get_pattern(manager)
+                if pattern and pattern.search(record.msg):
+                    record.msg = manager.mask_values(record.msg)
             except Exception:
                 pass  # Don't break logging if redaction fails
         return True
@@ -177,6 +205,27 @@ def configure_logging(
     root.info("Agent Zero logging configured", extra={"level": level, "redaction": enable_redaction})
 
 
+def configure_logging_from_env(level: Optional[str] = None) -> None:
+    """
+    Configure logging from the A0_LOG_* environment variables
+
+    Reads A0_LOG_LEVEL, A0_LOG_FILE and A0_LOG_TO_FILE so every entry point
+    that may call configure_logging first applies the same settings.
+
+    Args:
+        level: Optional level overriding A0_LOG_LEVEL (e.g. from --verbose)
+    """
+    log_file = os.getenv("A0_LOG_FILE", None)
+    enable_file = os.getenv("A0_LOG_TO_FILE", "false").lower() == "true"
+
+    configure_logging(
+        level=level or os.getenv("A0_LOG_LEVEL", "INFO"),
+        log_file=log_file if enable_file else None,
+        enable_redaction=True,
+        enable_console=True
+    )
+
+
 def get_logger(subsystem: LogSubsystem, context: Optional[Dict[str, Any]] = None) -> logging.Logger:
     """
     Get a logger for a specific subsystem
@@ -186,19 +235,40 @@ def get_logger(subsystem: LogSubsystem, context: Optional[Dict[str, Any]] = None
         context: Optional context dict to attach to all log messages
 
     Returns:
-        Configured Logger instance
+        Configured Logger instance (context adapters are cached, so equal
+        subsystem/context pairs return the same object)
 
     Example:
         >>> from python.helpers.log_config import get_logger, LogSubsystem
         >>> log = get_logger(LogSubsystem.TOOL)
         >>> log.info("Executing tool", extra={"tool_name": "code_execution"})
     """
-    logger = logging.getLogger(subsystem.value)
-
-    if context:
-        return ContextAdapter(logger, context)
+    if not context:
+        return logging.getLogger(subsystem.value)
 
-    return logger
+    try:
+        key = (subsystem.value, tuple(sorted(context.items())))
+        adapter = _logger_cache.get(key)
+    except TypeError:
+        # Unhashable context values cannot be cached
+        return ContextAdapter(logging.getLogger(subsystem.value), context)
+
+    if adapter is None:
+        adapter = ContextAdapter(logging.getLogger(subsystem.value), dict(context))
+        _logger_cache[key] = adapter
+        while len(_logger_cache) > _LOGGER_CACHE_MAX:
+            try:
+                _logger_cache.popitem(last=False)
+            except KeyError:
+                # Emptied by a concurrent reset_configuration()
+                break
+    else:
+        try:
+            _logger_cache.move_to_end(key)
+        except KeyError:
+            # Evicted by another thread between get() and here
+            pass
+    return adapter
 
 
 def set_subsystem_level(subsystem: LogSubsystem, level: str) -> None:
@@ -269,6 +339,7 @@ def reset_configuration() -> None:
     """
     global _configured
     _configured = False
+    _logger_cache.clear()
 
     root = logging.getLogger("a0")
     for handler in root.handlers[:]:
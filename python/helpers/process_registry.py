@@ -21,24 +21,34 @@ Usage:
     cleaned = registry.cleanup_zombies(max_age_seconds=1800)
 """
 
+import itertools
 import time
 import os
+import operator
 import signal
 import threading
-from typing import Dict, Optional, List, Callable, Any
+from collections import Counter
+from typing import Dict, Optional, List, Callable, Any, Tuple, Union
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 import uuid
 
 
-class ProcessStatus(str, Enum):
-    """Process lifecycle status"""
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    BACKGROUNDED = "backgrounded"
-    TIMEOUT = "timeout"
+class ProcessStatus(IntEnum):
+    """Process lifecycle status (serialized as the lowercase member name)"""
+    PENDING = 0
+    RUNNING = 1
+    COMPLETED = 2
+    FAILED = 3
+    BACKGROUNDED = 4
+    TIMEOUT = 5
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+_RUNNING_STATES = frozenset({ProcessStatus.RUNNING, ProcessStatus.BACKGROUNDED})
+_FINISHED_STATES = frozenset({ProcessStatus.COMPLETED, ProcessStatus.FAILED, ProcessStatus.TIMEOUT})
 
 
 @dataclass
@@ -67,11 +77,17 @@ class ProcessEntry:
     cwd: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def _duration_seconds(self, now: Optional[float] = None) -> float:
+        """Duration in seconds, measuring running entries up to `now`"""
+        if not self.started_at:
+            return 0
+        end = self.ended_at or (time.time() if now is None else now)
+        return end - self.started_at
+
     @property
     def duration_seconds(self) -> float:
         """Get process duration in seconds"""
-        end = self.ended_at or time.time()
-        return end - self.started_at if self.started_at else 0
+        return self._duration_seconds()
 
     @property
     def duration_ms(self) -> float:
@@ -81,32 +97,39 @@ class ProcessEntry:
     @property
     def is_running(self) -> bool:
         """Check if process is currently running"""
-        return self.status in (ProcessStatus.RUNNING, ProcessStatus.BACKGROUNDED)
+        return self.status in _RUNNING_STATES
 
     @property
     def is_finished(self) -> bool:
         """Check if process has finished (success or failure)"""
-        return self.status in (ProcessStatus.COMPLETED, ProcessStatus.FAILED, ProcessStatus.TIMEOUT)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation"""
-        return {
-            "id": self.id,
-            "command": self.command,
-            "pid": self.pid,
-            "status": self.status.value,
-            "started_at": self.started_at,
-            "ended_at": self.ended_at,
-            "exit_code": self.exit_code,
-            "duration_ms": self.duration_ms,
-            "cwd": self.cwd,
-            "metadata": self.metadata,
-        }
+        return self.status in _FINISHED_STATES
+
+    def snapshot(self) -> Tuple[ProcessStatus, Optional[int], Optional[float], Dict[str, Any]]:
+        """Post-run state as one tuple: (status, exit_code, ended_at, metadata)"""
+        return (self.status, self.exit_code, self.ended_at, self.metadata)
+
+    def to_dict(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary representation
+
+        Args:
+            now: Current timestamp for unfinished entries; pass one value
+                when serializing many entries to read the clock only once
+        """
+        d = dict(zip(_ENTRY_FIELDS, _entry_attrs(self)))
+        d["status"] = str(self.status)
+        d["duration_ms"] = self._duration_seconds(now) * 1000
+        return d
+
+
+# Field names serialized by ProcessEntry.to_dict, read in one attrgetter call
+_ENTRY_FIELDS = ("id", "command", "pid", "status", "started_at", "ended_at", "exit_code", "cwd", "metadata")
+_entry_attrs = operator.attrgetter(*_ENTRY_FIELDS)
 
 
 class ProcessRegistry:
     """
-    Process Registry - Singleton pattern
+    Process Registry - shared instance via get_instance()
 
     Tracks all processes started by Agent Zero for lifecycle management
     and zombie cleanup.
@@ -131,25 +154,17 @@ class ProcessRegistry:
         registry.cleanup_zombies(max_age_seconds=3600)
     """
 
-    _instance: Optional["ProcessRegistry"] = None
-    _lock = threading.Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    instance = super().__new__(cls)
-                    instance._entries: Dict[str, ProcessEntry] = {}
-                    instance._entry_lock = threading.Lock()
-                    instance._exit_callbacks: List[Callable[[ProcessEntry], None]] = []
-                    instance._max_history = 1000  # Max entries to keep in history
-                    cls._instance = instance
-        return cls._instance
-
-    @classmethod
-    def get_instance(cls) -> "ProcessRegistry":
+    def __init__(self):
+        self._entries: Dict[str, ProcessEntry] = {}
+        self._entry_lock = threading.Lock()
+        self._exit_callbacks: Dict[int, Callable[[ProcessEntry], None]] = {}
+        self._callback_tokens = itertools.count()
+        self._max_history = 1000  # Max entries to keep in history
+
+    @staticmethod
+    def get_instance() -> "ProcessRegistry":
         """Get the singleton instance"""
-        return cls()
+        return _registry
 
     def register(self, entry: ProcessEntry) -> str:
         """
@@ -162,13 +177,34 @@ class ProcessRegistry:
             The entry ID
         """
         with self._entry_lock:
-            entry.started_at = time.time()
-            if entry.status == ProcessStatus.PENDING:
-                entry.status = ProcessStatus.RUNNING
-            self._entries[entry.id] = entry
+            self._register_locked(entry, time.time())
             self._trim_history()
         return entry.id
 
+    def register_many(self, entries: List[ProcessEntry]) -> List[str]:
+        """
+        Register several process entries under a single lock acquisition
+
+        Args:
+            entries: ProcessEntry objects to register
+
+        Returns:
+            The entry IDs, in input order
+        """
+        with self._entry_lock:
+            now = time.time()
+            for entry in entries:
+                self._register_locked(entry, now)
+            self._trim_history()
+        return [entry.id for entry in entries]
+
+    def _register_locked(self, entry: ProcessEntry, now: float) -> None:
+        """Add an entry to the registry (must be called within _entry_lock)"""
+        entry.started_at = now
+        if entry.status == ProcessStatus.PENDING:
+            entry.status = ProcessStatus.RUNNING
+        self._entries[entry.id] = entry
+
     def get(self, entry_id: str) -> Optional[ProcessEntry]:
         """
         Get a process entry by ID
@@ -193,12 +229,7 @@ class ProcessRegistry:
         Returns:
             True if entry was found and updated
         """
-        with self._entry_lock:
-            if entry := self._entries.get(entry_id):
-                entry.status = ProcessStatus.RUNNING
-                entry.pid = pid
-                return True
-        return False
+        return self._transition(entry_id, ProcessStatus.RUNNING, pid=pid)
 
     def mark_completed(self, entry_id: str, exit_code: int = 0) -> bool:
         """
@@ -211,14 +242,7 @@ class ProcessRegistry:
         Returns:
             True if entry was found and updated
         """
-        with self._entry_lock:
-            if entry := self._entries.get(entry_id):
-                entry.status = ProcessStatus.COMPLETED
-                entry.exit_code = exit_code
-                entry.ended_at = time.time()
-                self._notify_exit(entry)
-                return True
-        return False
+        return self._transition(entry_id, ProcessStatus.COMPLETED, exit_code=exit_code)
 
     def mark_failed(self, entry_id: str, exit_code: int = 1, error: Optional[str] = None) -> bool:
         """
@@ -232,16 +256,9 @@ class ProcessRegistry:
         Returns:
             True if entry was found and updated
         """
-        with self._entry_lock:
-            if entry := self._entries.get(entry_id):
-                entry.status = ProcessStatus.FAILED
-                entry.exit_code = exit_code
-                entry.ended_at = time.time()
-                if error:
-                    entry.metadata["error"] = error
-                self._notify_exit(entry)
-                return True
-        return False
+        if error:
+            return self._transition(entry_id, ProcessStatus.FAILED, exit_code=exit_code, error=error)
+        return self._transition(entry_id, ProcessStatus.FAILED, exit_code=exit_code)
 
     def mark_timeout(self, entry_id: str) -> bool:
         """
@@ -253,15 +270,7 @@ class ProcessRegistry:
         Returns:
             True if entry was found and updated
         """
-        with self._entry_lock:
-            if entry := self._entries.get(entry_id):
-                entry.status = ProcessStatus.TIMEOUT
-                entry.exit_code = -1
-                entry.ended_at = time.time()
-                entry.metadata["timeout"] = True
-                self._notify_exit(entry)
-                return True
-        return False
+        return self._transition(entry_id, ProcessStatus.TIMEOUT, exit_code=-1, timeout=True)
 
     def mark_backgrounded(self, entry_id: str) -> bool:
         """
@@ -270,14 +279,49 @@ class ProcessRegistry:
         Args:
             entry_id: The process entry ID
 
+        Returns:
+            True if entry was found and updated
+        """
+        return self._transition(entry_id, ProcessStatus.BACKGROUNDED)
+
+    def _transition(
+        self,
+        entry_id: str,
+        status: ProcessStatus,
+        exit_code: Optional[int] = None,
+        pid: Optional[int] = None,
+        **metadata: Any,
+    ) -> bool:
+        """
+        Move an entry to a new status
+
+        Terminal statuses also stamp ended_at and notify exit callbacks.
+
+        Args:
+            entry_id: The process entry ID
+            status: New status
+            exit_code: Exit code to record, if any
+            pid: Operating system process ID to record, if any
+            **metadata: Keys merged into the entry metadata
+
         Returns:
             True if entry was found and updated
         """
         with self._entry_lock:
-            if entry := self._entries.get(entry_id):
-                entry.status = ProcessStatus.BACKGROUNDED
-                return True
-        return False
+            entry = self._entries.get(entry_id)
+            if not entry:
+                return False
+            entry.status = status
+            if pid is not None:
+                entry.pid = pid
+            if exit_code is not None:
+                entry.exit_code = exit_code
+            if metadata:
+                entry.metadata.update(metadata)
+            if entry.is_finished:
+                entry.ended_at = time.time()
+                self._notify_exit(entry)
+            return True
 
     def list_running(self) -> List[ProcessEntry]:
         """
@@ -312,6 +356,29 @@ class ProcessRegistry:
         with self._entry_lock:
             return [e for e in self._entries.values() if e.status == status]
 
+    def count_running(self) -> int:
+        """
+        Count currently running processes without building a list
+
+        Returns:
+            Number of running or backgrounded entries
+        """
+        with self._entry_lock:
+            return sum(1 for e in self._entries.values() if e.is_running)
+
+    def count_by_status(self, status: ProcessStatus) -> int:
+        """
+        Count processes with a given status without building a list
+
+        Args:
+            status: ProcessStatus to count
+
+        Returns:
+            Number of matching entries
+        """
+        with self._entry_lock:
+            return sum(1 for e in self._entries.values() if e.status == status)
+
     def kill(self, entry_id: str, force: bool = False) -> bool:
         """
         Kill a process by entry ID
@@ -400,45 +467,60 @@ class ProcessRegistry:
             Dict with status information
         """
         with self._entry_lock:
-            running = [e for e in self._entries.values() if e.status == ProcessStatus.RUNNING]
-            backgrounded = [e for e in self._entries.values() if e.status == ProcessStatus.BACKGROUNDED]
-            completed = [e for e in self._entries.values() if e.status == ProcessStatus.COMPLETED]
-            failed = [e for e in self._entries.values() if e.status == ProcessStatus.FAILED]
+            counts = Counter(e.status for e in self._entries.values())
+            running_pids = []
+            backgrounded_pids = []
+            if counts[ProcessStatus.RUNNING] or counts[ProcessStatus.BACKGROUNDED]:
+                for e in self._entries.values():
+                    if e.pid:
+                        if e.status == ProcessStatus.RUNNING:
+                            running_pids.append(e.pid)
+                        elif e.status == ProcessStatus.BACKGROUNDED:
+                            backgrounded_pids.append(e.pid)
 
             return {
                 "total": len(self._entries),
-                "running": len(running),
-                "backgrounded": len(backgrounded),
-                "completed": len(completed),
-                "failed": len(failed),
-                "running_pids": [e.pid for e in running if e.pid],
-                "backgrounded_pids": [e.pid for e in backgrounded if e.pid],
+                "running": counts[ProcessStatus.RUNNING],
+                "backgrounded": counts[ProcessStatus.BACKGROUNDED],
+                "completed": counts[ProcessStatus.COMPLETED],
+                "failed": counts[ProcessStatus.FAILED],
+                "running_pids": running_pids,
+                "backgrounded_pids": backgrounded_pids,
             }
 
-    def on_exit(self, callback: Callable[[ProcessEntry], None]) -> None:
+    def on_exit(self, callback: Callable[[ProcessEntry], None]) -> int:
         """
         Register a callback for process exit events
 
         Args:
             callback: Function to call when a process exits
+
+        Returns:
+            Token to pass to remove_exit_callback
         """
-        self._exit_callbacks.append(callback)
+        token = next(self._callback_tokens)
+        self._exit_callbacks[token] = callback
+        return token
 
-    def remove_exit_callback(self, callback: Callable[[ProcessEntry], None]) -> bool:
+    def remove_exit_callback(self, token: Union[int, Callable[[ProcessEntry], None]]) -> bool:
         """
         Remove an exit callback
 
         Args:
-            callback: The callback to remove
+            token: Token returned by on_exit (O(1)), or the callback itself,
+                matched by equality like list.remove (first registration wins)
 
         Returns:
             True if callback was found and removed
         """
-        try:
-            self._exit_callbacks.remove(callback)
-            return True
-        except ValueError:
-            return False
+        if callable(token):
+            token = next(
+                (t for t, cb in list(self._exit_callbacks.items()) if cb == token),
+                None,
+            )
+            if token is None:
+                return False
+        return self._exit_callbacks.pop(token, None) is not None
 
     def clear_history(self, keep_running: bool = True) -> int:
         """
@@ -452,17 +534,20 @@ class ProcessRegistry:
         """
         with self._entry_lock:
             if keep_running:
-                running = {k: v for k, v in self._entries.items() if v.is_running}
-                cleared = len(self._entries) - len(running)
-                self._entries = running
-            else:
-                cleared = len(self._entries)
-                self._entries = {}
+                # Delete in place rather than rebuilding the dict
+                to_clear = [k for k, v in self._entries.items() if not v.is_running]
+                for entry_id in to_clear:
+                    del self._entries[entry_id]
+                return len(to_clear)
+
+            cleared = len(self._entries)
+            self._entries.clear()
             return cleared
 
     def _notify_exit(self, entry: ProcessEntry) -> None:
         """Notify exit callbacks"""
-        for callback in self._exit_callbacks:
+        # Snapshot so callbacks may unregister themselves
+        for callback in list(self._exit_callbacks.values()):
             try:
                 callback(entry)
             except Exception:
@@ -483,7 +568,11 @@ class ProcessRegistry:
             del self._entries[entry_id]
 
 
+# Shared instance, created at import so concurrent first calls cannot race
+_registry = ProcessRegistry()
+
+
 # Convenience function
 def get_registry() -> ProcessRegistry:
     """Get the global ProcessRegistry instance"""
-    return ProcessRegistry.get_instance()
+    return _registry
@@ -7,11 +7,12 @@ per-session configuration such as model overrides, log levels, and context limit
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionPolicy:
     """Session policy configuration.
     
@@ -86,6 +87,8 @@ class SessionPolicyManager:
         >>> print(policy.model_override)
         gpt-4o
     """
+
+    __slots__ = ("_policies", "_default_policy")
     
     def __init__(self):
         """Initialize SessionPolicyManager."""
@@ -101,7 +104,9 @@ class SessionPolicyManager:
         Returns:
             SessionPolicy (session-specific or default)
         """
-        return self._policies.get(session_id, self._default_policy)
+        # Keys are interned on insert, so an interned lookup key
+        # resolves with an identity compare instead of a string compare
+        return self._policies.get(sys.intern(session_id), self._default_policy)
     
     def set_policy(
         self,
@@ -127,6 +132,7 @@ class SessionPolicyManager:
         Returns:
             Created SessionPolicy
         """
+        session_id = sys.intern(session_id)
         policy = SessionPolicy(
             session_id=session_id,
             model_override=model_override,
@@ -191,8 +197,7 @@ class SessionPolicyManager:
         Returns:
             Model name to use
         """
-        policy = self.get_policy(session_id)
-        return policy.get_effective_model(default_model)
+        return self.get_policy(session_id).model_override or default_model
     
     def list_sessions(self) -> list:
         """List all sessions with custom policies.
@@ -231,8 +236,9 @@ class SessionPolicyManager:
         return f"SessionPolicyManager(sessions={len(self._policies)})"
 
 
-# Global instance for convenience
-_policy_manager: Optional[SessionPolicyManager] = None
+# Global instance for convenience, created at import so concurrent
+# first calls cannot build two managers
+_policy_manager = SessionPolicyManager()
 
 
 def get_policy_manager() -> SessionPolicyManager:
@@ -241,9 +247,6 @@ def get_policy_manager() -> SessionPolicyManager:
     Returns:
         SessionPolicyManager singleton
     """
-    global _policy_manager
-    if _policy_manager is None:
-        _policy_manager = SessionPolicyManager()
     return _policy_manager
 
 
@@ -9,15 +9,12 @@ Agent Zero 统一启动入口 (V4.1)
 """
 
 import argparse
+import importlib
 import logging
 import os
 import sys
 import threading
 import time
-from pathlib import Path
-
-# 确保项目根目录在 Python 路径中
-sys.path.insert(0, str(Path(__file__).parent))
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,11 +23,61 @@ logging.basicConfig(
 logger = logging.getLogger("agent-zero")
 
 
-def run_gateway_in_thread(host: str, port: int, log_level: str):
-    """在独立线程中运行 Gateway"""
+# Gateway 就绪等待上限（秒），lifespan 中的渠道/MCP 启动可能较慢
+DEFAULT_GATEWAY_READY_TIMEOUT = 60.0
+
+
+def gateway_ready_timeout() -> float:
+    """读取 GATEWAY_READY_TIMEOUT 环境变量，非法值回退到默认值"""
+    raw = os.environ.get("GATEWAY_READY_TIMEOUT")
+    if not raw:
+        return DEFAULT_GATEWAY_READY_TIMEOUT
+    try:
+        value = float(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        logger.warning(
+            f"Invalid GATEWAY_READY_TIMEOUT={raw!r}, using {DEFAULT_GATEWAY_READY_TIMEOUT}s"
+        )
+        return DEFAULT_GATEWAY_READY_TIMEOUT
+    return value
+
+
+# 后台预加载的 Web UI 第三方依赖。只放无导入副作用的第三方包：
+# run_ui / python.helpers / agent 之间存在循环导入且导入时有副作用，
+# 与 Gateway 线程并发导入可能拿到半初始化的模块，因此不在此列
+UI_PREWARM_MODULES = ("flask", "werkzeug", "fastmcp")
+
+
+def prewarm_imports(module_names):
+    """后台预加载模块，失败时记 debug 日志，留给主线程导入时再抛出"""
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            logger.debug(f"Prewarm import of {module_name} failed", exc_info=True)
+
+
+def run_gateway_in_thread(
+    host: str, port: int, log_level: str, ready: threading.Event, status: dict
+):
+    """在独立线程中运行 Gateway，端口绑定完成后置位 ready
+
+    status["phase"] 记录当前启动阶段，供主线程在超时时报告卡在哪一步
+    """
+    status["phase"] = "importing uvicorn"
     import asyncio
     import uvicorn
 
+    class _ReadyServer(uvicorn.Server):
+        async def startup(self, sockets=None):
+            status["phase"] = "lifespan startup (channels/MCP) and port bind"
+            await super().startup(sockets=sockets)
+            if not self.should_exit:
+                status["phase"] = "ready"
+                ready.set()
+
     # 创建新的事件循环
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
@@ -42,7 +89,8 @@ def run_gateway_in_thread(host: str, port: int, log_level: str):
         log_level=log_level,
         loop="asyncio",
     )
-    server = uvicorn.Server(config)
+    server = _ReadyServer(config)
+    status["phase"] = "loading gateway app"
 
     try:
         loop.run_until_complete(server.serve())
@@ -108,18 +156,43 @@ def main():
     logger.info("AgentContext: 共享内存模式")
     logger.info("=" * 60)
 
+    # 后台预加载 Web UI 第三方依赖，与 Gateway 线程的导入并行
+    threading.Thread(
+        target=prewarm_imports,
+        args=(UI_PREWARM_MODULES,),
+        daemon=True,
+        name="UIPrewarmThread"
+    ).start()
+
     # 启动 Gateway 线程
+    gateway_ready = threading.Event()
+    gateway_status = {"phase": "thread starting"}
     gateway_thread = threading.Thread(
         target=run_gateway_in_thread,
-        args=(args.gateway_host, args.gateway_port, log_level),
+        args=(args.gateway_host, args.gateway_port, log_level, gateway_ready, gateway_status),
         daemon=True,
         name="GatewayThread"
     )
     gateway_thread.start()
     logger.info("Gateway thread started")
 
-    # 等待 Gateway 启动
-    time.sleep(1)
+    # 等待 Gateway 完成端口绑定；超时或失败时只记录日志，Web UI 照常启动
+    ready_timeout = gateway_ready_timeout()
+    deadline = time.monotonic() + ready_timeout
+    while not gateway_ready.wait(timeout=0.5):
+        if not gateway_thread.is_alive():
+            logger.error(
+                f"Gateway exited during phase: {gateway_status['phase']}; "
+                "starting Web UI without it"
+            )
+            break
+        if time.monotonic() >= deadline:
+            logger.error(
+                f"Gateway not ready after {ready_timeout}s "
+                f"(stalled in phase: {gateway_status['phase']}); "
+                "starting Web UI anyway"
+            )
+            break
 
     # 在主线程运行 Web UI
     try:
@@ -18,11 +18,6 @@ import argparse
 import logging
 import os
 import sys
-from pathlib import Path
-
-# Ensure project root is in Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +27,21 @@ logging.basicConfig(
 logger = logging.getLogger("agent-zero.gateway")
 
 
+def _default_workers() -> int:
+    """Read GATEWAY_WORKERS, falling back to 1 on empty or invalid values"""
+    raw = os.environ.get("GATEWAY_WORKERS")
+    if not raw:
+        return 1
+    try:
+        workers = int(raw)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning("Invalid GATEWAY_WORKERS=%r, using 1", raw)
+        return 1
+    return workers
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Agent Zero Gateway - Multi-channel messaging service"
@@ -66,8 +76,16 @@ def main():
         action="store_true",
         help="Enable auto-reload (development mode)"
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=_default_workers(),
+        help="Worker processes (default: 1; each worker runs its own channels, ignored with --reload)"
+    )
 
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     # Set environment variables for the gateway
     os.environ["GATEWAY_CONFIG_PATH"] = args.config
@@ -76,14 +94,18 @@ def main():
 
     log_level = "debug" if args.verbose else "info"
 
+    # Set up the a0.* subsystem loggers before agent modules are imported
+    from python.helpers.log_config import configure_logging_from_env
+    configure_logging_from_env(level="DEBUG" if args.verbose else None)
+
     # Print startup banner
     logger.info("=" * 60)
     logger.info("Agent Zero Gateway - Multi-Channel Messaging Service")
     logger.info("=" * 60)
-    logger.info(f"Host:   {args.host}")
-    logger.info(f"Port:   {args.port}")
-    logger.info(f"Config: {args.config}")
-    logger.info(f"Health: http://{args.host}:{args.port}/api/health")
+    logger.info("Host:   %s", args.host)
+    logger.info("Port:   %s", args.port)
+    logger.info("Config: %s", args.config)
+    logger.info("Health: http://%s:%s/api/health", args.host, args.port)
     logger.info("=" * 60)
 
     # Start the gateway
@@ -94,14 +116,15 @@ def main():
             port=args.port,
             reload=args.reload,
             log_level=log_level,
+            workers=args.workers,
         )
     except ImportError as e:
-        logger.error(f"Failed to import gateway module: {e}")
+        logger.error("Failed to import gateway module: %s", e)
         logger.error("Please ensure all dependencies are installed:")
-        logger.error("  pip install fastapi uvicorn python-telegram-bot discord.py")
+        logger.error("  pip install fastapi uvicorn httptools orjson python-telegram-bot discord.py")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Gateway startup failed: {e}")
+        logger.error("Gateway startup failed: %s", e)
         sys.exit(1)
 
 